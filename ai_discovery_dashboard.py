@@ -1,9 +1,11 @@
 import pandas as pd
+import pyarrow.csv as pacsv
 import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
+from types import SimpleNamespace
 
 # Configure Streamlit page
 st.set_page_config(
@@ -13,7 +15,40 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-@st.cache_data
+# Functions with fewer responses than this don't get a deep-dive view -
+# keeps near-empty or typo'd groups from multiplying render work
+MIN_FUNCTION_RESPONSES = 3
+
+# Survey question headers renamed for easier handling
+COLUMN_MAPPING = {
+    'Submitted By': 'name',
+    'Q1:  SCG Function - Which group are you from ?': 'function',
+    'Q2. Top 3 Time-Intensive Repetitive Tasks: (Select the top 3 tasks that consumes MOST time in your typical work week)': 'top_tasks',
+    'Q2a. For the identified tasks above, estimate what percentage of your time (in a week) you spend working on them.': 'time_percentage',
+    'Q2b. Do you use automation/AI tools to perform the identified time-consuming tasks above?': 'uses_automation',
+    'If you answered \'Yes\', please specify what automation/AI tools and the task that it is currently used for.': 'automation_tools',
+    'Q3. AI Tools Familiar With: Do you use any AI tools for your work tasks? ': 'ai_tools_used',
+    'Q4. AI Tool Usage: How frequently do you currently use AI tools in your work?': 'usage_frequency',
+    'Q5. Current Proficiency Level: How would you rate your current proficiency level with AI tools?': 'proficiency_level',
+    'Q6. Current Challenges:  When using AI tools for work, what are your biggest challenges? (Select all that apply)': 'challenges',
+    'Q7. Skillset Needs: Which AI prompt engineering skills would help you most in your daily work? (Select up to 3)': 'skill_needs',
+    'Q8. Future Possibilities:  Which areas of GT\'s corporate functions do you think AI can drive impact and effectiveness?': 'future_possibilities'
+}
+
+def _clean_column_names(names):
+    """Strip headers, mangle duplicates ('Others' -> 'Others.1') the way
+    pandas' reader does, and apply the short-name mapping in one pass"""
+    seen = {}
+    cleaned = []
+    for col in names:
+        col = col.strip()
+        count = seen.get(col, 0)
+        seen[col] = count + 1
+        if count:
+            col = f'{col}.{count}'
+        cleaned.append(COLUMN_MAPPING.get(col, col))
+    return cleaned
+
 def load_and_process_data():
     """Load and process the AI Discovery survey data"""
     # Load the CSV file - handle both local and deployment paths
@@ -21,97 +56,168 @@ def load_and_process_data():
     csv_path = 'data/AI_Discovery_Responses.csv'
     if not os.path.exists(csv_path):
         csv_path = os.path.join(os.path.dirname(__file__), 'data', 'AI_Discovery_Responses.csv')
-    
-    # Read CSV with error handling for malformed data
+
+    # Reuse the Parquet sidecar from a previous run if it is still fresh -
+    # it already holds the cleaned, typed frame, so no re-parsing is needed
+    parquet_path = csv_path + '.parquet'
+    if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path):
+        return pd.read_parquet(parquet_path)
+
+    # Read CSV with PyArrow's multithreaded parser (much faster than the
+    # pandas engines), skipping malformed rows like on_bad_lines='skip'.
+    # strings_can_be_null matches pandas' empty-field-to-NaN behavior and
+    # newlines_in_values tolerates line breaks inside free-text answers.
     try:
-        df = pd.read_csv(csv_path, on_bad_lines='skip', engine='python')
-    except Exception as e:
-        st.error(f"Error reading CSV file: {e}")
-        return pd.DataFrame()
-    
-    # Clean column names
-    df.columns = [col.strip() for col in df.columns]
-    
-    # Rename columns for easier handling
-    column_mapping = {
-        'Submitted By': 'name',
-        'Q1:  SCG Function - Which group are you from ?': 'function',
-        'Q2. Top 3 Time-Intensive Repetitive Tasks: (Select the top 3 tasks that consumes MOST time in your typical work week)': 'top_tasks',
-        'Q2a. For the identified tasks above, estimate what percentage of your time (in a week) you spend working on them.': 'time_percentage',
-        'Q2b. Do you use automation/AI tools to perform the identified time-consuming tasks above?': 'uses_automation',
-        'If you answered \'Yes\', please specify what automation/AI tools and the task that it is currently used for.': 'automation_tools',
-        'Q3. AI Tools Familiar With: Do you use any AI tools for your work tasks? ': 'ai_tools_used',
-        'Q4. AI Tool Usage: How frequently do you currently use AI tools in your work?': 'usage_frequency',
-        'Q5. Current Proficiency Level: How would you rate your current proficiency level with AI tools?': 'proficiency_level',
-        'Q6. Current Challenges:  When using AI tools for work, what are your biggest challenges? (Select all that apply)': 'challenges',
-        'Q7. Skillset Needs: Which AI prompt engineering skills would help you most in your daily work? (Select up to 3)': 'skill_needs',
-        'Q8. Future Possibilities:  Which areas of GT\'s corporate functions do you think AI can drive impact and effectiveness?': 'future_possibilities'
-    }
-    
-    df = df.rename(columns=column_mapping)
-    
+        table = pacsv.read_csv(
+            csv_path,
+            read_options=pacsv.ReadOptions(use_threads=True),
+            parse_options=pacsv.ParseOptions(
+                invalid_row_handler=lambda row: 'skip',
+                newlines_in_values=True
+            ),
+            convert_options=pacsv.ConvertOptions(strings_can_be_null=True)
+        )
+        # Rename on the Arrow table so pandas never walks the original
+        # column objects, then convert with zero-copy Arrow-backed dtypes
+        table = table.rename_columns(_clean_column_names(table.column_names))
+        df = table.to_pandas(types_mapper=pd.ArrowDtype)
+    except Exception:
+        # Parse edge case PyArrow can't handle - fall back to pandas' C engine
+        try:
+            df = pd.read_csv(csv_path, on_bad_lines='skip')
+            df.columns = _clean_column_names(df.columns)
+        except Exception as e:
+            st.error(f"Error reading CSV file: {e}")
+            return pd.DataFrame()
+
     # Clean and process the data
-    df['time_percentage'] = pd.to_numeric(df['time_percentage'], errors='coerce')
+    # Values are 0-100, so float32 holds them exactly at half the bandwidth
+    df['time_percentage'] = pd.to_numeric(df['time_percentage'], errors='coerce', downcast='float')
     df['uses_automation'] = df['uses_automation'].fillna('No')
+    # Precomputed 'Yes' mask so aggregations sum a bool column instead of
+    # dispatching a Python lambda per group
+    df['_is_auto'] = df['uses_automation'].eq('Yes')
     
     # Clean function names
     df['function'] = df['function'].str.strip()
-    
+
+    # Low-cardinality answer columns: store as category so groupbys and
+    # equality filters run on integer codes instead of strings
+    for col in ['uses_automation', 'proficiency_level', 'usage_frequency']:
+        df[col] = df[col].astype('category')
+
+    # 'function' gets a sorted, ordered dtype so the function list is
+    # available for free later via .cat.categories
+    df['function'] = df['function'].astype(
+        pd.CategoricalDtype(sorted(df['function'].dropna().unique()), ordered=True))
+
+    # Persist the cleaned frame so later cold starts skip the CSV parse
+    try:
+        df.to_parquet(parquet_path, compression='zstd', engine='pyarrow')
+    except OSError:
+        pass  # read-only deployment - just re-parse next time
+
     return df
 
 def create_overview_metrics(df):
     """Create overview metrics for the dashboard"""
     total_responses = len(df)
     avg_time_spent = df['time_percentage'].mean()
-    automation_users = len(df[df['uses_automation'] == 'Yes'])
-    automation_rate = (automation_users / total_responses) * 100
-    
+    is_automated = df['_is_auto']
+    automation_users = int(is_automated.sum())
+    automation_rate = is_automated.mean() * 100
+
     return total_responses, avg_time_spent, automation_users, automation_rate
 
+def explode_multiselect(df, column):
+    """Explode a comma-separated multi-select column into a long-form
+    (function, value) frame, split and stripped once for all consumers"""
+    long_df = df[['function', column]].dropna(subset=[column]).copy()
+    long_df[column] = long_df[column].str.split(',', regex=False)
+    long_df = long_df.explode(column)
+    long_df[column] = long_df[column].str.strip()
+    # trailing/double commas produce empty tokens - don't count them
+    long_df = long_df[long_df[column].str.len() > 0]
+    return long_df
+
+def build_function_cache(df):
+    """Precompute per-function slices and aggregates in a single groupby pass"""
+    challenges_long = explode_multiselect(df, 'challenges')
+    skills_long = explode_multiselect(df, 'skill_needs')
+
+    # One crosstab pass gives every (function x answer) count, so the
+    # per-function tallies below are row lookups, not per-slice value_counts
+    prof_xtab = pd.crosstab(df['function'], df['proficiency_level'])
+    freq_xtab = pd.crosstab(df['function'], df['usage_frequency'])
+
+    def row_counts(xtab, function):
+        counts = xtab.loc[function].sort_values(ascending=False)
+        return counts[counts > 0]
+
+    cache = {}
+    for function, func_df in df.groupby('function', observed=True):
+        cache[function] = {
+            'df': func_df,
+            'proficiency_counts': row_counts(prof_xtab, function),
+            'freq_counts': row_counts(freq_xtab, function),
+            'challenge_counts': challenges_long.loc[challenges_long['function'] == function, 'challenges'].value_counts(),
+            'skill_counts': skills_long.loc[skills_long['function'] == function, 'skill_needs'].value_counts()
+        }
+
+    # All-functions entry under None so the Overview shares the same
+    # precomputed counts instead of re-running value_counts on the frame
+    cache[None] = {
+        'df': df,
+        'proficiency_counts': prof_xtab.sum().sort_values(ascending=False),
+        'freq_counts': freq_xtab.sum().sort_values(ascending=False),
+        'challenge_counts': challenges_long['challenges'].value_counts(),
+        'skill_counts': skills_long['skill_needs'].value_counts()
+    }
+    return cache
+
 def create_function_breakdown(df):
     """Create function-level breakdown"""
-    function_stats = df.groupby('function').agg({
-        'name': 'count',
-        'time_percentage': 'mean',
-        'uses_automation': lambda x: (x == 'Yes').sum()
-    }).reset_index()
-    
-    function_stats.columns = ['Function', 'Response_Count', 'Avg_Time_Percentage', 'Automation_Users']
+    # Single vectorized pass with named aggregations - size skips the
+    # null-check of count and the bool sum replaces a per-group lambda
+    function_stats = (
+        df.groupby('function', observed=True)
+        .agg(
+            Response_Count=('name', 'size'),
+            Avg_Time_Percentage=('time_percentage', 'mean'),
+            Automation_Users=('_is_auto', 'sum')
+        )
+        .reset_index()
+        .rename(columns={'function': 'Function'})
+    )
     function_stats['Automation_Rate'] = (function_stats['Automation_Users'] / function_stats['Response_Count']) * 100
-    
+
+    # A function whose respondents all skipped the time question yields a
+    # NaN mean; zero it here so no consumer needs a per-row isna branch
+    function_stats['Avg_Time_Percentage'] = function_stats['Avg_Time_Percentage'].fillna(0)
+
     return function_stats
 
-def plot_proficiency_distribution(df, selected_function=None):
-    """Plot proficiency level distribution"""
-    if selected_function and selected_function != 'All Functions':
-        plot_df = df[df['function'] == selected_function]
-        title = f"AI Proficiency Distribution - {selected_function}"
-    else:
-        plot_df = df
-        title = "AI Proficiency Distribution - All Functions"
-    
-    proficiency_counts = plot_df['proficiency_level'].value_counts()
-    
+@st.cache_resource
+def plot_proficiency_distribution(proficiency_counts, selected_function=None):
+    """Plot proficiency level distribution from precomputed counts"""
+    title = f"AI Proficiency Distribution - {selected_function or 'All Functions'}"
+
     fig = px.pie(
         values=proficiency_counts.values,
         names=proficiency_counts.index,
         title=title,
         color_discrete_sequence=px.colors.qualitative.Set3
     )
-    
+
+    fig.update_layout(uirevision='dashboard')
+
     return fig
 
-def plot_usage_frequency(df, selected_function=None):
-    """Plot usage frequency distribution"""
-    if selected_function and selected_function != 'All Functions':
-        plot_df = df[df['function'] == selected_function]
-        title = f"AI Usage Frequency - {selected_function}"
-    else:
-        plot_df = df
-        title = "AI Usage Frequency - All Functions"
-    
-    freq_counts = plot_df['usage_frequency'].value_counts()
-    
+@st.cache_resource
+def plot_usage_frequency(freq_counts, selected_function=None):
+    """Plot usage frequency distribution from precomputed counts"""
+    title = f"AI Usage Frequency - {selected_function or 'All Functions'}"
+
     fig = px.bar(
         x=freq_counts.index,
         y=freq_counts.values,
@@ -119,29 +225,18 @@ def plot_usage_frequency(df, selected_function=None):
         labels={'x': 'Usage Frequency', 'y': 'Number of Respondents'},
         color_discrete_sequence=['#1f77b4']
     )
-    
-    fig.update_layout(xaxis_tickangle=-45)
-    
+
+    fig.update_layout(xaxis_tickangle=-45, hovermode='x', uirevision='dashboard')
+    fig.update_traces(marker_line_width=0)
+
     return fig
 
-def plot_top_challenges(df, selected_function=None):
-    """Plot top challenges faced by users"""
-    if selected_function and selected_function != 'All Functions':
-        plot_df = df[df['function'] == selected_function]
-        title = f"Top AI Challenges - {selected_function}"
-    else:
-        plot_df = df
-        title = "Top AI Challenges - All Functions"
-    
-    # Process challenges (they're comma-separated)
-    all_challenges = []
-    for challenges in plot_df['challenges'].dropna():
-        if isinstance(challenges, str):
-            challenge_list = [c.strip() for c in challenges.split(',')]
-            all_challenges.extend(challenge_list)
-    
-    challenge_counts = pd.Series(all_challenges).value_counts().head(10)
-    
+@st.cache_resource
+def plot_top_challenges(challenge_counts, selected_function=None):
+    """Plot top challenges from precomputed counts"""
+    title = f"Top AI Challenges - {selected_function or 'All Functions'}"
+    challenge_counts = challenge_counts.head(10)
+
     fig = px.bar(
         y=challenge_counts.index,
         x=challenge_counts.values,
@@ -150,13 +245,14 @@ def plot_top_challenges(df, selected_function=None):
         orientation='h',
         color_discrete_sequence=['#ff7f0e']
     )
-    
+
+    fig.update_layout(uirevision='dashboard')
+
     return fig
 
-def plot_automation_usage(df):
-    """Plot automation usage by function"""
-    function_stats = create_function_breakdown(df)
-    
+@st.cache_resource
+def plot_automation_usage(function_stats):
+    """Plot automation usage by function from the precomputed breakdown"""
     fig = px.bar(
         function_stats,
         x='Function',
@@ -166,15 +262,32 @@ def plot_automation_usage(df):
         color='Automation_Rate',
         color_continuous_scale='Viridis'
     )
-    
-    fig.update_layout(xaxis_tickangle=-45)
-    
+
+    fig.update_layout(xaxis_tickangle=-45, hovermode='x', uirevision='dashboard')
+    fig.update_traces(marker_line_width=0)
+
     return fig
 
+def build_automation_opportunity(df):
+    """Per-function time allocation: manual vs automated hours and the
+    savings from automating half the manual share, in one groupby pass"""
+    agg = (
+        df.assign(_manual=df['time_percentage'].where(~df['_is_auto'], 0))
+        .groupby('function', observed=True)
+        .agg(total=('time_percentage', 'sum'), manual=('_manual', 'sum'))
+    )
+
+    return pd.DataFrame({
+        'Function': agg.index,
+        'Current Manual Hours': agg['manual'].values,
+        'Already Automated': (agg['total'] - agg['manual']).values,
+        'Potential Savings (50%)': (agg['manual'] * 0.5).values
+    })
+
 def calculate_time_savings_potential(df):
     """Calculate potential time savings from automation"""
     total_weekly_hours = df['time_percentage'].sum()
-    current_automation_hours = df[df['uses_automation'] == 'Yes']['time_percentage'].sum()
+    current_automation_hours = df.loc[df['_is_auto'], 'time_percentage'].sum()
     manual_hours = total_weekly_hours - current_automation_hours
     
     # Potential savings with 50% automation of manual tasks
@@ -188,50 +301,118 @@ def calculate_time_savings_potential(df):
         'automation_opportunity': manual_hours / total_weekly_hours * 100 if total_weekly_hours > 0 else 0
     }
 
+@st.cache_resource
+def get_dashboard_data():
+    """Load the survey frame and bundle every derived structure behind a
+    single cache entry, so a rerun costs one lookup and no helper call
+    ever hashes a DataFrame argument. Callers must not mutate the bundle."""
+    df = load_and_process_data()
+    # Raw-responses view for the survey-data expander, projected once so
+    # reruns hand the widget the same object instead of a fresh slice
+    display_columns = ['name', 'function', 'time_percentage', 'uses_automation',
+                       'usage_frequency', 'proficiency_level']
+    function_breakdown = create_function_breakdown(df)
+    # Deep-dive selectbox options: the sorted categories, minus functions
+    # with too few responses for a meaningful view
+    response_counts = function_breakdown.set_index('Function')['Response_Count']
+    functions = [f for f in df['function'].cat.categories
+                 if response_counts.get(f, 0) >= MIN_FUNCTION_RESPONSES]
+    return SimpleNamespace(
+        df=df,
+        functions=functions,
+        overview_view=df[display_columns].head(500),
+        overview_metrics=create_overview_metrics(df),
+        function_cache=build_function_cache(df),
+        function_breakdown=function_breakdown,
+        automation_opportunity=build_automation_opportunity(df),
+        savings=calculate_time_savings_potential(df)
+    )
+
+@st.fragment
+def render_savings_calculator(total_manual_hours):
+    """Interactive time savings calculator - runs as a fragment so slider
+    moves rerun only this block instead of the whole dashboard"""
+    col1, col2 = st.columns([1, 1])
+
+    with col1:
+        automation_percentage = st.slider(
+            "Automation Level (%)",
+            min_value=0,
+            max_value=100,
+            value=50,
+            step=5,
+            help="Percentage of manual tasks to automate"
+        )
+
+        calculated_savings = total_manual_hours * (automation_percentage / 100)
+        annual_calculated_savings = calculated_savings * 52
+
+    with col2:
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 20px; border-radius: 10px; color: white;">
+            <h4>💡 Projected Savings</h4>
+            <p><strong>Weekly:</strong> {calculated_savings:.0f} hours</p>
+            <p><strong>Annual:</strong> {annual_calculated_savings:.0f} hours</p>
+            <p><strong>FTE Equivalent:</strong> {annual_calculated_savings/2080:.1f} positions</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # ROI Message
+    if automation_percentage >= 50:
+        st.success(f"🎉 With {automation_percentage}% automation, you could save {calculated_savings:.0f} hours weekly - equivalent to {annual_calculated_savings/2080:.1f} full-time positions annually!")
+    elif automation_percentage >= 25:
+        st.info(f"💼 {automation_percentage}% automation would free up {calculated_savings:.0f} hours weekly for strategic work.")
+    else:
+        st.warning(f"⚠️ Only {automation_percentage}% automation leaves significant opportunity on the table.")
+
 def main():
     """Main dashboard function"""
     st.title("🚀 AI Discovery Survey Dashboard")
     st.markdown("### *Unlocking Automation Potential Across Corporate Functions*")
     
-    # Load data
-    df = load_and_process_data()
-    
-    # Calculate time savings potential
-    savings_data = calculate_time_savings_potential(df)
+    # Load the frame and all precomputed aggregates in one cache lookup
+    data = get_dashboard_data()
+    df = data.df
+    savings_data = data.savings
+
+    # Shared per-function aggregate cache (None key = all functions)
+    function_cache = data.function_cache
     
     # Hero section with key insights
     st.markdown("---")
     st.markdown("## 💡 **Key Insights: The Automation Opportunity**")
     
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("""
-        <div style="background: linear-gradient(90deg, #ff6b6b, #ffa726); padding: 20px; border-radius: 10px; text-align: center;">
-            <h2 style="color: white; margin: 0;">⚠️ {:.0f}%</h2>
-            <p style="color: white; margin: 5px 0;"><strong>Manual Tasks</strong></p>
-            <p style="color: white; font-size: 14px; margin: 0;">Still done manually</p>
-        </div>
-        """.format(savings_data['automation_opportunity']), unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div style="background: linear-gradient(90deg, #4ecdc4, #45b7d1); padding: 20px; border-radius: 10px; text-align: center;">
-            <h2 style="color: white; margin: 0;">💰 {:.0f} hrs</h2>
-            <p style="color: white; margin: 5px 0;"><strong>Weekly Savings</strong></p>
-            <p style="color: white; font-size: 14px; margin: 0;">With 50% automation</p>
-        </div>
-        """.format(savings_data['potential_savings_50']), unsafe_allow_html=True)
-    
-    with col3:
-        annual_savings = savings_data['potential_savings_50'] * 52
-        st.markdown("""
-        <div style="background: linear-gradient(90deg, #96ceb4, #ffeaa7); padding: 20px; border-radius: 10px; text-align: center;">
-            <h2 style="color: white; margin: 0;">📈 {:.0f} hrs</h2>
-            <p style="color: white; margin: 5px 0;"><strong>Annual Savings</strong></p>
-            <p style="color: white; font-size: 14px; margin: 0;">Potential per year</p>
-        </div>
-        """.format(annual_savings), unsafe_allow_html=True)
+    # Native st.metric cards are much lighter DOM than the old inline-HTML
+    # gradient cards; one small style block keeps the hero look
+    st.markdown("""
+    <style>
+    .st-key-hero_metrics div[data-testid="stMetric"] {
+        background: linear-gradient(90deg, #ff6b6b, #ffa726);
+        padding: 20px;
+        border-radius: 10px;
+        text-align: center;
+    }
+    .st-key-hero_metrics div[data-testid="stMetric"] * {
+        color: white !important;
+    }
+    </style>
+    """, unsafe_allow_html=True)
+
+    with st.container(key="hero_metrics"):
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            st.metric("⚠️ Manual Tasks", f"{savings_data['automation_opportunity']:.0f}%",
+                      help="Share of tracked time still done manually")
+
+        with col2:
+            st.metric("💰 Weekly Savings", f"{savings_data['potential_savings_50']:.0f} hrs",
+                      help="With 50% automation of manual tasks")
+
+        with col3:
+            annual_savings = savings_data['potential_savings_50'] * 52
+            st.metric("📈 Annual Savings", f"{annual_savings:.0f} hrs",
+                      help="Potential per year")
     
     # Call to action
     st.markdown("---")
@@ -252,46 +433,27 @@ def main():
         st.header("📈 Overall Survey Analysis")
         
         # Overview metrics
-        total_responses, avg_time_spent, automation_users, automation_rate = create_overview_metrics(df)
-        
-        # Display metrics as infographic cards
-        col1, col2, col3, col4 = st.columns(4)
+        total_responses, avg_time_spent, automation_users, automation_rate = data.overview_metrics
         
-        with col1:
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #74b9ff, #0984e3); padding: 20px; border-radius: 10px; text-align: center; color: white;">
-                <div style="font-size: 30px;">👥</div>
-                <div style="font-size: 24px; font-weight: bold; margin: 5px 0;">{total_responses}</div>
-                <div style="font-size: 14px;">Survey Responses</div>
-            </div>
-            """, unsafe_allow_html=True)
-    
-        with col2:
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #fd79a8, #e84393); padding: 20px; border-radius: 10px; text-align: center; color: white;">
-                <div style="font-size: 30px;">⏰</div>
-                <div style="font-size: 24px; font-weight: bold; margin: 5px 0;">{avg_time_spent:.0f}%</div>
-                <div style="font-size: 14px;">Avg Time on Tasks</div>
-            </div>
-            """, unsafe_allow_html=True)
-    
-        with col3:
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #55efc4, #00b894); padding: 20px; border-radius: 10px; text-align: center; color: white;">
-                <div style="font-size: 30px;">🤖</div>
-                <div style="font-size: 24px; font-weight: bold; margin: 5px 0;">{automation_users}/{total_responses}</div>
-                <div style="font-size: 14px;">Using Automation</div>
-            </div>
-            """, unsafe_allow_html=True)
-    
-        with col4:
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #fdcb6e, #e17055); padding: 20px; border-radius: 10px; text-align: center; color: white;">
-                <div style="font-size: 30px;">📊</div>
-                <div style="font-size: 24px; font-weight: bold; margin: 5px 0;">{automation_rate:.0f}%</div>
-                <div style="font-size: 14px;">Automation Rate</div>
-            </div>
-            """, unsafe_allow_html=True)
+        # Display metrics as infographic cards - all four cards go out in
+        # one markdown call (one websocket frame, one browser reflow)
+        metric_cards = [
+            ('👥', f'{total_responses}', 'Survey Responses', '#74b9ff, #0984e3'),
+            ('⏰', f'{avg_time_spent:.0f}%', 'Avg Time on Tasks', '#fd79a8, #e84393'),
+            ('🤖', f'{automation_users}/{total_responses}', 'Using Automation', '#55efc4, #00b894'),
+            ('📊', f'{automation_rate:.0f}%', 'Automation Rate', '#fdcb6e, #e17055')
+        ]
+        st.markdown(
+            '<div style="display: grid; grid-template-columns: repeat(4, 1fr); gap: 1rem;">'
+            + ''.join(f"""
+            <div style="background: linear-gradient(135deg, {gradient}); padding: 20px; border-radius: 10px; text-align: center; color: white;">
+                <div style="font-size: 30px;">{icon}</div>
+                <div style="font-size: 24px; font-weight: bold; margin: 5px 0;">{value}</div>
+                <div style="font-size: 14px;">{label}</div>
+            </div>""" for icon, value, label, gradient in metric_cards)
+            + '</div>',
+            unsafe_allow_html=True
+        )
     
         st.markdown("---")
     
@@ -302,9 +464,10 @@ def main():
     
         with col1:
             st.markdown("#### 📊 AI Proficiency Levels")
-            proficiency_counts = df['proficiency_level'].value_counts()
-        
+            proficiency_counts = function_cache[None]['proficiency_counts']
+
             total_responses = len(df)
+            proficiency_bars = []
             for level, count in proficiency_counts.items():
                 percentage = (count / total_responses) * 100
             
@@ -322,8 +485,8 @@ def main():
                     icon = '○'
                     level_short = level[:20] + '...' if len(level) > 20 else level
             
-                # Create progress bar
-                st.markdown(f"""
+                # Accumulate the progress bars, emitted as one block below
+                proficiency_bars.append(f"""
                 <div style="margin: 15px 0;">
                     <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 5px;">
                         <span style="font-weight: bold;">{icon} {level_short}</span>
@@ -332,13 +495,15 @@ def main():
                     <div style="background-color: #f0f0f0; border-radius: 10px; height: 20px;">
                         <div style="background: linear-gradient(90deg, #2E86AB, #A23B72); width: {percentage}%; height: 100%; border-radius: 10px;"></div>
                     </div>
-                </div>
-                """, unsafe_allow_html=True)
+                </div>""")
+
+            st.markdown(''.join(proficiency_bars), unsafe_allow_html=True)
     
         with col2:
             st.markdown("#### 📈 Usage Frequency")
-            frequency_counts = df['usage_frequency'].value_counts()
-        
+            frequency_counts = function_cache[None]['freq_counts']
+
+            frequency_bars = []
             for freq, count in frequency_counts.items():
                 percentage = (count / total_responses) * 100
             
@@ -359,7 +524,7 @@ def main():
                     icon = '○'
                     freq_short = freq[:15] + '...' if len(freq) > 15 else freq
             
-                st.markdown(f"""
+                frequency_bars.append(f"""
                 <div style="margin: 15px 0;">
                     <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 5px;">
                         <span style="font-weight: bold;">{icon} {freq_short}</span>
@@ -368,29 +533,16 @@ def main():
                     <div style="background-color: #f0f0f0; border-radius: 10px; height: 20px;">
                         <div style="background: linear-gradient(90deg, #F18F01, #C73E1D); width: {percentage}%; height: 100%; border-radius: 10px;"></div>
                     </div>
-                </div>
-                """, unsafe_allow_html=True)
+                </div>""")
+
+            st.markdown(''.join(frequency_bars), unsafe_allow_html=True)
     
         # Automation Opportunity Visualization
         st.subheader("🎯 Automation Opportunity Analysis")
     
-        # Create automation potential chart
-        automation_data = []
-        for func in df['function'].unique():
-            func_df = df[df['function'] == func]
-            total_time = func_df['time_percentage'].sum()
-            manual_time = func_df[func_df['uses_automation'] == 'No']['time_percentage'].sum()
-            automated_time = total_time - manual_time
-            potential_savings = manual_time * 0.5
-        
-            automation_data.append({
-                'Function': func,
-                'Current Manual Hours': manual_time,
-                'Already Automated': automated_time,
-                'Potential Savings (50%)': potential_savings
-            })
-    
-        automation_df = pd.DataFrame(automation_data)
+        # Create automation potential chart from the cached per-function
+        # time-allocation aggregate
+        automation_df = data.automation_opportunity
     
         # Create stacked bar chart
         fig_automation = px.bar(
@@ -407,108 +559,104 @@ def main():
                 'Potential Savings (50%)': '#f39c12'
             }
         )
-        fig_automation.update_layout(xaxis_tickangle=-45)
-        st.plotly_chart(fig_automation, use_container_width=True)
+        fig_automation.update_layout(xaxis_tickangle=-45, hovermode='x', uirevision='dashboard')
+        fig_automation.update_traces(marker_line_width=0)
+        st.plotly_chart(fig_automation, use_container_width=True, key="automation_opportunity_chart")
+
+        # Survey data on demand: aggregated stats first, raw responses capped
+        # to the key columns and first 500 rows so we never ship the full
+        # frame to the browser on every rerun
+        with st.expander("📋 View Survey Data"):
+            st.markdown("**Per-Function Summary**")
+            st.dataframe(
+                data.function_breakdown,
+                use_container_width=True,
+                hide_index=True,
+                column_config={
+                    'Function': st.column_config.TextColumn('Function'),
+                    'Response_Count': st.column_config.NumberColumn('Responses'),
+                    'Avg_Time_Percentage': st.column_config.NumberColumn(
+                        'Avg Time on Tasks', format='%.0f%%'),
+                    'Automation_Users': st.column_config.NumberColumn('Using Automation'),
+                    'Automation_Rate': st.column_config.ProgressColumn(
+                        'Automation Rate', format='%.0f%%', min_value=0, max_value=100)
+                }
+            )
+            st.markdown("**Raw Responses (first 500)**")
+            st.dataframe(data.overview_view, use_container_width=True)
     
         # Challenges & Barriers Infographic
         st.markdown("---")
         st.subheader("🚧 Top Challenges & Barriers")
     
-        # Process challenges data
-        challenges_data = []
-        for _, row in df.iterrows():
-            if pd.notna(row['challenges']):
-                challenges = row['challenges'].split(',')
-                for challenge in challenges:
-                    challenges_data.append(challenge.strip())
-    
-        challenge_counts = pd.Series(challenges_data).value_counts().head(6)
+        # Tally challenges from the precomputed all-functions counts
+        challenge_counts = function_cache[None]['challenge_counts'].head(6)
     
-        # Create challenge cards
-        cols = st.columns(3)
+        # Shorten challenge text for display, vectorized over the index
+        # (normalized to the default string dtype: .str indexing rejects the
+        # Arrow list dtype that splitting an Arrow-backed index produces)
+        short_challenges = pd.Series(challenge_counts.index, dtype='str').str.split(',', regex=False).str[0]
+        short_challenges = short_challenges.where(
+            short_challenges.str.len() <= 30, short_challenges.str.slice(0, 30) + '...'
+        )
+
+        # Create challenge cards, batched into a single grid
         challenge_icons = ['🎯', '⚡', '🔒', '⏰', '🎨', '📚']
-    
-        for i, (challenge, count) in enumerate(challenge_counts.items()):
-            with cols[i % 3]:
-                icon = challenge_icons[i % len(challenge_icons)]
-                percentage = (count / len(df)) * 100
-            
-                # Shorten challenge text for display
-                short_challenge = challenge.split(',')[0] if ',' in challenge else challenge
-                if len(short_challenge) > 30:
-                    short_challenge = short_challenge[:30] + "..."
-            
-                st.markdown(f"""
-                <div style="
-                    background: linear-gradient(135deg, #ff9a9e 0%, #fecfef 50%, #fecfef 100%);
-                    border-radius: 15px;
-                    padding: 15px;
-                    text-align: center;
-                    margin: 10px 0;
-                    box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-                ">
-                    <div style="font-size: 30px; margin-bottom: 10px;">{icon}</div>
-                    <div style="font-size: 14px; font-weight: bold; color: #333; margin-bottom: 5px;">
-                        {short_challenge}
-                    </div>
-                    <div style="font-size: 20px; font-weight: bold; color: #e91e63;">
-                        {count}
-                    </div>
-                    <div style="font-size: 12px; color: #666;">
-                        ({percentage:.0f}% of respondents)
-                    </div>
+        challenge_cards = []
+
+        for i, (short_challenge, count) in enumerate(zip(short_challenges, challenge_counts)):
+            icon = challenge_icons[i % len(challenge_icons)]
+            percentage = (count / len(df)) * 100
+
+            challenge_cards.append(f"""
+            <div style="
+                background: linear-gradient(135deg, #ff9a9e 0%, #fecfef 50%, #fecfef 100%);
+                border-radius: 15px;
+                padding: 15px;
+                text-align: center;
+                margin: 10px 0;
+                box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+            ">
+                <div style="font-size: 30px; margin-bottom: 10px;">{icon}</div>
+                <div style="font-size: 14px; font-weight: bold; color: #333; margin-bottom: 5px;">
+                    {short_challenge}
                 </div>
-                """, unsafe_allow_html=True)
+                <div style="font-size: 20px; font-weight: bold; color: #e91e63;">
+                    {count}
+                </div>
+                <div style="font-size: 12px; color: #666;">
+                    ({percentage:.0f}% of respondents)
+                </div>
+            </div>""")
+
+        st.markdown(
+            '<div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 1rem;">'
+            + ''.join(challenge_cards)
+            + '</div>',
+            unsafe_allow_html=True
+        )
     
         # Interactive Time Savings Calculator
         st.markdown("---")
         st.subheader("🧮 Interactive Time Savings Calculator")
     
-        col1, col2 = st.columns([1, 1])
-    
-        with col1:
-            automation_percentage = st.slider(
-                "Automation Level (%)", 
-                min_value=0, 
-                max_value=100, 
-                value=50, 
-                step=5,
-                help="Percentage of manual tasks to automate"
-            )
-        
-            total_manual_hours = savings_data['manual_hours']
-            calculated_savings = total_manual_hours * (automation_percentage / 100)
-            annual_calculated_savings = calculated_savings * 52
-        
-        with col2:
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 20px; border-radius: 10px; color: white;">
-                <h4>💡 Projected Savings</h4>
-                <p><strong>Weekly:</strong> {calculated_savings:.0f} hours</p>
-                <p><strong>Annual:</strong> {annual_calculated_savings:.0f} hours</p>
-                <p><strong>FTE Equivalent:</strong> {annual_calculated_savings/2080:.1f} positions</p>
-            </div>
-            """, unsafe_allow_html=True)
-    
-        # ROI Message
-        if automation_percentage >= 50:
-            st.success(f"🎉 With {automation_percentage}% automation, you could save {calculated_savings:.0f} hours weekly - equivalent to {annual_calculated_savings/2080:.1f} full-time positions annually!")
-        elif automation_percentage >= 25:
-            st.info(f"💼 {automation_percentage}% automation would free up {calculated_savings:.0f} hours weekly for strategic work.")
-        else:
-            st.warning(f"⚠️ Only {automation_percentage}% automation leaves significant opportunity on the table.")
+        render_savings_calculator(savings_data['manual_hours'])
     
         # Visual Summary & Call to Action
         st.markdown("---")
         st.subheader("🚀 Ready to Transform? Here's Your Action Plan")
     
-        # Create action plan cards
-        action_cols = st.columns(3)
-    
-        with action_cols[0]:
-            st.markdown("""
+        # Create action plan cards, batched into a single grid
+        action_cards = [
+            ('🎯', 'Phase 1: Quick Wins', 'Start with simple task automation for immediate impact', '#667eea 0%, #764ba2 100%'),
+            ('📈', 'Phase 2: Scale Up', 'Expand automation to repetitive processes across functions', '#f093fb 0%, #f5576c 100%'),
+            ('🎉', 'Phase 3: Transform', 'Achieve strategic automation goals and measure ROI', '#4facfe 0%, #00f2fe 100%')
+        ]
+        st.markdown(
+            '<div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 1rem;">'
+            + ''.join(f"""
             <div style="
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+                background: linear-gradient(135deg, {gradient});
                 border-radius: 15px;
                 padding: 25px;
                 text-align: center;
@@ -518,49 +666,13 @@ def main():
                 flex-direction: column;
                 justify-content: center;
             ">
-                <div style="font-size: 40px; margin-bottom: 15px;">🎯</div>
-                <h4 style="margin: 10px 0;">Phase 1: Quick Wins</h4>
-                <p style="margin: 0; font-size: 14px;">Start with simple task automation for immediate impact</p>
-            </div>
-            """, unsafe_allow_html=True)
-    
-        with action_cols[1]:
-            st.markdown("""
-            <div style="
-                background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
-                border-radius: 15px;
-                padding: 25px;
-                text-align: center;
-                color: white;
-                height: 200px;
-                display: flex;
-                flex-direction: column;
-                justify-content: center;
-            ">
-                <div style="font-size: 40px; margin-bottom: 15px;">📈</div>
-                <h4 style="margin: 10px 0;">Phase 2: Scale Up</h4>
-                <p style="margin: 0; font-size: 14px;">Expand automation to repetitive processes across functions</p>
-            </div>
-            """, unsafe_allow_html=True)
-    
-        with action_cols[2]:
-            st.markdown("""
-            <div style="
-                background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);
-                border-radius: 15px;
-                padding: 25px;
-                text-align: center;
-                color: white;
-                height: 200px;
-                display: flex;
-                flex-direction: column;
-                justify-content: center;
-            ">
-                <div style="font-size: 40px; margin-bottom: 15px;">🎉</div>
-                <h4 style="margin: 10px 0;">Phase 3: Transform</h4>
-                <p style="margin: 0; font-size: 14px;">Achieve strategic automation goals and measure ROI</p>
-            </div>
-            """, unsafe_allow_html=True)
+                <div style="font-size: 40px; margin-bottom: 15px;">{icon}</div>
+                <h4 style="margin: 10px 0;">{title}</h4>
+                <p style="margin: 0; font-size: 14px;">{text}</p>
+            </div>""" for icon, title, text, gradient in action_cards)
+            + '</div>',
+            unsafe_allow_html=True
+        )
     
         # Final impact statement
         st.markdown("---")
@@ -591,102 +703,102 @@ def main():
     with main_tabs[1]:
         st.header("🏢 Function-Specific Deep Dive")
         
-        function_stats = create_function_breakdown(df)
-        functions = function_stats['Function'].tolist()
+        function_stats = data.function_breakdown
+
+        # Render only the selected function - st.tabs would execute every
+        # tab body on each rerun, multiplying the work by the function count
+        function = st.selectbox("Select Function", data.functions)
+
+        # Look up the precomputed slice and aggregates for this function
+        func_cache = function_cache[function]
+        func_df = func_cache['df']
+        func_stats = function_stats[function_stats['Function'] == function].iloc[0]
+        
+        # Function overview metrics
+        col1, col2, col3, col4 = st.columns(4)
         
-        # Create tabs for each function
-        function_tabs = st.tabs([f"📊 {func}" for func in functions])
+        with col1:
+            st.metric("Number of Respondents", f"{func_stats['Response_Count']}")
+        
+        with col2:
+            automation_rate = func_stats['Automation_Rate']
+            st.metric("Automation Rate", f"{automation_rate:.0f}%")
+        
+        with col3:
+            avg_time = func_stats['Avg_Time_Percentage']
+            st.metric("Avg Time on Tasks", f"{avg_time:.0f}%")
+        
+        with col4:
+            automation_users = func_stats['Automation_Users']
+            st.metric("Using AI Tools", f"{automation_users}")
+        
+        st.markdown("---")
         
-        for i, function in enumerate(functions):
-            with function_tabs[i]:
-                # Filter data for this function
-                func_df = df[df['function'] == function]
-                func_stats = function_stats[function_stats['Function'] == function].iloc[0]
-                
-                # Function overview metrics
-                col1, col2, col3, col4 = st.columns(4)
-                
-                with col1:
-                    st.metric("Number of Respondents", f"{func_stats['Response_Count']}")
-                
-                with col2:
-                    automation_rate = func_stats['Automation_Rate']
-                    st.metric("Automation Rate", f"{automation_rate:.0f}%")
-                
-                with col3:
-                    avg_time = func_stats['Avg_Time_Percentage']
-                    st.metric("Avg Time on Tasks", f"{avg_time:.0f}%")
-                
-                with col4:
-                    automation_users = func_stats['Automation_Users']
-                    st.metric("Using AI Tools", f"{automation_users}")
-                
-                st.markdown("---")
-                
-                # Detailed analysis
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.subheader("🎯 AI Readiness Overview")
-                    
-                    # Proficiency breakdown for this function
-                    prof_counts = func_df['proficiency_level'].value_counts()
-                    for level, count in prof_counts.items():
-                        percentage = (count / len(func_df)) * 100
-                        level_short = level.split('–')[0].strip() if '–' in level else level[:15]
-                        st.write(f"**{level_short}**: {count} ({percentage:.0f}%)")
-                    
-                    st.write("")
-                    
-                    # Usage frequency for this function
-                    st.subheader("📈 Usage Patterns")
-                    freq_counts = func_df['usage_frequency'].value_counts()
-                    for freq, count in freq_counts.items():
-                        percentage = (count / len(func_df)) * 100
-                        freq_short = freq.split('(')[0].strip()
-                        st.write(f"**{freq_short}**: {count} ({percentage:.0f}%)")
-                
-                with col2:
-                    st.subheader("🚧 Top Challenges")
-                    
-                    # Extract challenges for this function
-                    func_challenges = []
-                    for _, row in func_df.iterrows():
-                        if pd.notna(row['challenges']):
-                            challenges = row['challenges'].split(',')
-                            for challenge in challenges:
-                                func_challenges.append(challenge.strip())
-                    
-                    if func_challenges:
-                        challenge_counts = pd.Series(func_challenges).value_counts().head(5)
-                        for challenge, count in challenge_counts.items():
-                            percentage = (count / len(func_df)) * 100
-                            # Shorten long challenge names
-                            short_challenge = challenge[:50] + "..." if len(challenge) > 50 else challenge
-                            st.write(f"• **{short_challenge}** ({count} mentions, {percentage:.0f}%)")
-                    else:
-                        st.write("No specific challenges reported")
-                    
-                    st.write("")
-                    
-                    st.subheader("💡 Skill Development Needs")
-                    
-                    # Extract skill needs for this function
-                    func_skills = []
-                    for _, row in func_df.iterrows():
-                        if pd.notna(row['skill_needs']):
-                            skills = row['skill_needs'].split(',')
-                            for skill in skills:
-                                func_skills.append(skill.strip())
-                    
-                    if func_skills:
-                        skill_counts = pd.Series(func_skills).value_counts().head(3)
-                        for skill, count in skill_counts.items():
-                            percentage = (count / len(func_df)) * 100
-                            short_skill = skill[:50] + "..." if len(skill) > 50 else skill
-                            st.write(f"• **{short_skill}** ({count} requests, {percentage:.0f}%)")
-                    else:
-                        st.write("No specific skill needs reported")
+        # Detailed analysis
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.subheader("🎯 AI Readiness Overview")
+            
+            # Proficiency breakdown for this function - one element per
+            # list, not one st.write round-trip per answer
+            prof_counts = func_cache['proficiency_counts']
+            prof_lines = []
+            for level, count in prof_counts.items():
+                percentage = (count / len(func_df)) * 100
+                level_short = level.split('–')[0].strip() if '–' in level else level[:15]
+                prof_lines.append(f"**{level_short}**: {count} ({percentage:.0f}%)")
+            st.markdown('  \n'.join(prof_lines))
+
+            st.write("")
+
+            # Usage frequency for this function
+            st.subheader("📈 Usage Patterns")
+            freq_counts = func_cache['freq_counts']
+            freq_lines = []
+            for freq, count in freq_counts.items():
+                percentage = (count / len(func_df)) * 100
+                freq_short = freq.split('(')[0].strip()
+                freq_lines.append(f"**{freq_short}**: {count} ({percentage:.0f}%)")
+            st.markdown('  \n'.join(freq_lines))
+        
+        with col2:
+            st.subheader("🚧 Top Challenges")
+            
+            # Precomputed challenge tallies for this function
+            challenge_counts = func_cache['challenge_counts'].head(5)
+            if len(challenge_counts) > 0:
+                # Shorten long challenge names with vectorized .str ops
+                short_challenges = pd.Series(challenge_counts.index, dtype='str')
+                short_challenges = short_challenges.where(
+                    short_challenges.str.len() <= 50, short_challenges.str.slice(0, 50) + '...'
+                )
+                challenge_lines = [
+                    f"• **{label}** ({count} mentions, {count / len(func_df) * 100:.0f}%)"
+                    for label, count in zip(short_challenges, challenge_counts)
+                ]
+                st.markdown('  \n'.join(challenge_lines))
+            else:
+                st.write("No specific challenges reported")
+            
+            st.write("")
+            
+            st.subheader("💡 Skill Development Needs")
+            
+            # Precomputed skill-need tallies for this function
+            skill_counts = func_cache['skill_counts'].head(3)
+            if len(skill_counts) > 0:
+                short_skills = pd.Series(skill_counts.index, dtype='str')
+                short_skills = short_skills.where(
+                    short_skills.str.len() <= 50, short_skills.str.slice(0, 50) + '...'
+                )
+                skill_lines = [
+                    f"• **{label}** ({count} requests, {count / len(func_df) * 100:.0f}%)"
+                    for label, count in zip(short_skills, skill_counts)
+                ]
+                st.markdown('  \n'.join(skill_lines))
+            else:
+                st.write("No specific skill needs reported")
 
 if __name__ == "__main__":
     main()